@@ -513,7 +513,7 @@ def main():
                 task.charger.is_charging() # pylint: disable=pointless-statement
                 scheduler.register_task(uri)
             except RuntimeError:
-                debug('Self-test failed on %d, unregister from the scheduler' %
+                debug('Self-test failed on %d, unregister from the scheduler',
                       i)
                 scheduler.unregister_task(uri)
 
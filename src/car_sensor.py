@@ -96,7 +96,7 @@ class CarSensor(Sensor):
         return {'state of charge': '%', 'mileage': 'mi'}
 
     def _connect(self):
-        debug('Trying to connect to %s' % self.mac)
+        debug('Trying to connect to %s', self.mac)
         self.myobd = obd.OBD(portstr=self.port, baudrate=self.baudrate,
                              protocol='6', fast=False)
         if self.myobd.status() == obd.OBDStatus.NOT_CONNECTED:
@@ -111,7 +111,7 @@ class CarSensor(Sensor):
                 time.sleep(.3)
                 if resp and resp.value:
                     self.record[key] = resp.value
-                    debug('{%s: %s}' % (key, self.record))
+                    debug('{%s: %s}', key, self.record)
                     success = True
                     break
         if not success:
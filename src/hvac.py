@@ -37,7 +37,7 @@ from datetime import timedelta
 from enum import IntEnum
 from math import ceil, floor
 from select import select
-from time import sleep
+from time import monotonic, sleep
 
 import pyecobee
 import Pyro5.api
@@ -55,7 +55,7 @@ from power_simulator import PowerSimulatorProxy
 from scheduler import Priority, SchedulerProxy, Task
 from sensor import Sensor
 from tools import (NameServer, Settings, debug, get_storage, init,
-                   log_exception, my_excepthook)
+                   log_exception, my_excepthook, seconds_until_next_minute)
 from watchdog import WatchdogProxy
 from weather import WeatherProxy
 
@@ -97,7 +97,9 @@ class HVACTask(Task, Sensor):
         self._started_at = None
         self._stopped_at = datetime.min
         self.cache = TTLCache(5, timedelta(seconds=3), datetime.now)
-        self.model = HVACModel()
+        # The model is read-only, share the one already loaded by 'param'
+        # instead of reading the hvac_model table a second time.
+        self.model = param.hvac_model
 
     def _deviation(self, target=False, comfort=False):
         if target:
@@ -235,11 +237,11 @@ class HVACTask(Task, Sensor):
         run_time = max(timedelta(seconds=1),
                        self._estimate_runtime(target=True, comfort=True))
         min_ratio = min(1, .95 * self.param.max_available_power / self.power)
-        debug('min ratio=%s'
-              % min(1, .95 * self.param.max_available_power / self.power))
+        debug('min ratio=%s',
+              min(1, .95 * self.param.max_available_power / self.power))
         if timedelta(0) < self.param.target_time - datetime.now() < run_time:
             coefficient = (self.param.target_time - datetime.now()) / run_time
-            debug('updated min_ratio=%s' % (min_ratio * coefficient * coefficient))
+            debug('updated min_ratio=%s', min_ratio * coefficient * coefficient)
             min_ratio = min_ratio * coefficient * coefficient
             return ratio >= min_ratio or min_ratio <= .15
         if self.is_running():
@@ -490,8 +492,8 @@ class HVACParam(threading.Thread):
                 time = start + timedelta(minutes=minute + step / 2)
                 temp_at = self.weather.temperature_at(time)
                 tmp += (step * self.home_model.degree_per_minute(tmp, temp_at))
-            debug('%d %.3F at %s should lead to %.3fF at %s'
-                  % (step, start_temp, start, tmp, end))
+            debug('%d %.3F at %s should lead to %.3fF at %s',
+                  step, start_temp, start, tmp, end)
             deviation = temperature - tmp
             if abs(deviation) < precision:
                 if step == 1:
@@ -499,7 +501,7 @@ class HVACParam(threading.Thread):
                 step = 1
             else:
                 step = max(1, min(max_step, floor(abs(deviation) * max_step)))
-            debug('+=%s' % (deviation * 2 / 3))
+            debug('+=%s', deviation * 2 / 3)
             start_temp += deviation * 2 /3
 
         times = [(start + timedelta(minutes=x)).timestamp() \
@@ -541,11 +543,10 @@ class HVACParam(threading.Thread):
                     self._compute_passive_curve(datetime.now(), goal_time,
                                                 self.settings.goal_temperature)
                     if datetime.now() < self.target_time:
-                        debug('At Target Time (%s): %s'
-                              % (self.target_time,
-                                 self._data['passive_curve'](self.target_time.timestamp())))
-                    debug('Now: %s'
-                          % self._data['passive_curve'](datetime.now().timestamp()))
+                        debug('At Target Time (%s): %s', self.target_time,
+                              self._data['passive_curve'](self.target_time.timestamp()))
+                    debug('Now: %s',
+                          self._data['passive_curve'](datetime.now().timestamp()))
                 except (RuntimeError, Pyro5.errors.PyroError):
                     log_exception('Uncaught exception in run()',  *sys.exc_info())
                     debug(''.join(Pyro5.errors.get_pyro_traceback()))
@@ -615,13 +616,12 @@ def main():
             monitor.track('ecobee service', False)
 
         while True:
-            now = datetime.now()
-            timeout = 60 - (now.second + now.microsecond/1000000.0)
-            next_cycle = now + timedelta(seconds=timeout)
+            timeout = seconds_until_next_minute()
+            deadline = monotonic() + timeout
             sockets, _, _ = select(daemon.sockets, [], [])
             if sockets:
                 daemon.events(sockets)
-            if datetime.now() >= next_cycle:
+            if monotonic() >= deadline:
                 break
 
 if __name__ == "__main__":
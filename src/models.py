@@ -29,13 +29,10 @@
 '''Process the database and generate models like the HVAC performance model.'''
 
 import argparse
-from datetime import timedelta
-from statistics import mean, median
+from datetime import datetime, timedelta
+from statistics import mean
 
 import numpy as np
-import pylab as plt
-import statsmodels.api as sm
-from dateutil.parser import parse as parse_time
 from scipy.interpolate import Rbf, interp1d
 
 from tools import (db_dict_factory, db_dict_to_table, db_table_to_dict,
@@ -45,12 +42,20 @@ SETTINGS = {'min_running_power': 4.5,
             'power_sensor_keys': ['a_c', 'air_handler'],
             'min_stop': 20}
 
+def _pyplot():
+    # Plotting is only used when this module is run as a script. Import pylab
+    # lazily so that services relying on the models (like hvac) do not pay
+    # for loading matplotlib.
+    # pylint: disable=import-outside-toplevel
+    import pylab
+    return pylab
+
 class DataPoint:
     def __init__(self, database, start, power):
         self.database = database
         self.start = self.end = start
         self._usage = [power]
-        self._outdoor = self._indoor = self._indoor_change = None
+        self._outdoor = self._indoor_temps = None
 
     def add(self, time, power):
         self.end = time
@@ -58,7 +63,7 @@ class DataPoint:
 
     @property
     def power(self):
-        return median(self._usage)
+        return np.median(self._usage).item()
 
     @power.setter
     def power(self, power):
@@ -83,8 +88,9 @@ class DataPoint:
 
         if after == before:
             return before[field]
-        zero = parse_time(before['timestamp'])
-        fun = interp1d([0, (parse_time(after['timestamp']) - zero).seconds],
+        zero = datetime.fromisoformat(before['timestamp'])
+        fun = interp1d([0, (datetime.fromisoformat(after['timestamp'])
+                            - zero).seconds],
                        [before[field], after[field]], fill_value="extrapolate")
         return fun((time - zero).seconds).item()
 
@@ -95,19 +101,20 @@ class DataPoint:
             self._outdoor = mean([start, end])
         return self._outdoor
 
+    def _indoor_at_start_and_end(self):
+        # indoor() and indoor_change() rely on the same two records, query the
+        # database only once for both.
+        if self._indoor_temps is None:
+            self._indoor_temps = (self._field_at('home', 'hvac', self.start),
+                                  self._field_at('home', 'hvac', self.end))
+        return self._indoor_temps
+
     def indoor(self):
-        if self._indoor is None:
-            start = self._field_at('home', 'hvac', self.start)
-            end = self._field_at('home', 'hvac', self.end)
-            self._indoor = mean([start, end])
-        return self._indoor
+        return mean(self._indoor_at_start_and_end())
 
     def indoor_change(self):
-        if self._indoor_change is None:
-            start = self._field_at('home', 'hvac', self.start)
-            end = self._field_at('home', 'hvac', self.end)
-            self._indoor_change = end - start
-        return self._indoor_change
+        start, end = self._indoor_at_start_and_end()
+        return end - start
 
     def valid(self):
         return (self.outdoor() - self.indoor()) * self.indoor_change() > 0
@@ -121,6 +128,9 @@ class HVACModel:
     '''
     def __init__(self, datapoints=None):
         if datapoints:
+            # Only needed to generate the model, not to load it.
+            # pylint: disable=import-outside-toplevel
+            import statsmodels.api as sm
             datapoints.sort(key=lambda x: x.outdoor())
             points = [point for point in datapoints \
                       if point.indoor_change() != 0]
@@ -155,6 +165,7 @@ class HVACModel:
         return timedelta(minutes=self._time_model(temperature).item())
 
     def plot(self):
+        plt = _pyplot()
         _, ax1 = plt.subplots()
         temperatures = self._power_model.x
 
@@ -216,17 +227,17 @@ class HomeModel:
         return self._time_model(indoor, outdoor).item()
 
     def plot(self):
-        edges = np.linspace(min(self.data, key=lambda x: x['outdoor'])['outdoor'],
-                            max(self.data, key=lambda x: x['outdoor'])['outdoor'],
-                            800)
+        plt = _pyplot()
+        outdoor = np.array([point['outdoor'] for point in self.data])
+        indoor = np.array([point['indoor'] for point in self.data])
+        edges = np.linspace(outdoor.min(), outdoor.max(), 800)
         centers = edges[:-1] + np.diff(edges[:2])[0] / 2.
         plt.pcolormesh(*np.meshgrid(edges, edges),
                        self._time_model(*np.meshgrid(centers, centers)),
                        shading='flat', cmap='RdBu_r', vmin=-0.05, vmax=0.05)
         plt.title('Home Thermal Model')
         plt.colorbar(label='°F / minute')
-        plt.xlim(min(self.data, key=lambda x: x['indoor'])['indoor'],
-                 max(self.data, key=lambda x: x['indoor'])['indoor'])
+        plt.xlim(indoor.min(), indoor.max())
         plt.xlabel('Indoor temperature (°F)')
         plt.ylabel('Outdoor temperature (°F)')
 
@@ -251,17 +262,21 @@ def build_datapoints(min_hour, max_hour, min_duration, max_duration,
     with get_database() as database:
         database.row_factory = db_dict_factory
         cursor = database.cursor()
-        cursor.execute('SELECT * FROM power ORDER BY timestamp ASC')
+        # Only load the columns the HVAC usage is computed from.
+        cursor.execute('SELECT timestamp, %s FROM power ORDER BY timestamp ASC'
+                       % ', '.join(SETTINGS['power_sensor_keys']))
         while True:
             row = cursor.fetchone()
             if row is None:
                 return points
-            if parse_time(row['timestamp']).month in [10, 11]:
+            # Timestamps are stored in ISO format which is much faster to
+            # parse with fromisoformat() than with the dateutil parser.
+            time = datetime.fromisoformat(row['timestamp'])
+            if time.month in [10, 11]:
                 continue
             usage = hvac_usage(row)
             if predicate(row):
-                point = DataPoint(database, parse_time(row['timestamp']),
-                                  usage)
+                point = DataPoint(database, time, usage)
                 if not min_hour <= point.start.hour <= max_hour:
                     continue
                 while True:
@@ -270,7 +285,8 @@ def build_datapoints(min_hour, max_hour, min_duration, max_duration,
                         break
                     usage = hvac_usage(row)
                     if predicate(row):
-                        point.add(parse_time(row['timestamp']), usage)
+                        point.add(datetime.fromisoformat(row['timestamp']),
+                                  usage)
                         if point.duration() < max_duration:
                             continue
                         points.append(point)
@@ -325,6 +341,7 @@ def main():
         model = desc['class']()
     if args.action == 'plot;save' or args.action == 'plot':
         model.plot()
+        plt = _pyplot()
         plt.grid(visible=True, which='both', axis='both', linestyle='dotted')
         plt.show()
     if args.action == 'plot;save' or args.action == 'save':
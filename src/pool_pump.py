@@ -41,7 +41,6 @@ from datetime import datetime
 from datetime import time as dtime
 from datetime import timedelta
 from select import select
-from statistics import mean
 
 import Pyro5
 import requests
@@ -55,7 +54,7 @@ from power_simulator import PowerSimulatorProxy
 from scheduler import Priority, SchedulerProxy, Task
 from sensor import Sensor, SensorReader
 from tools import (NameServer, Settings, debug, get_database, init,
-                   log_exception, my_excepthook)
+                   log_exception, my_excepthook, seconds_until_next_minute)
 from watchdog import WatchdogProxy
 from weather import WeatherProxy
 
@@ -212,7 +211,7 @@ class PoolPump(Task, Sensor):
         self._settings = settings
         self.healthy = True
         self.filter_is_clean = True
-        self._powers = []
+        self._reset_power_stats()
         self.started_at = None
         self.target_time = datetime.min
         self.remaining_runtime = timedelta()
@@ -232,6 +231,14 @@ class PoolPump(Task, Sensor):
         debug(f'Remaining runtime: {self.remaining_runtime}')
         self.last_update = now
 
+    def _reset_power_stats(self):
+        # Running statistics of the power used since the pump started. They
+        # are kept as running values rather than a list of samples growing
+        # for the entire run.
+        self._power_count = 0
+        self._power_sum = 0.0
+        self._power_max = float('-inf')
+
     @Pyro5.api.expose
     @Pyro5.api.oneway
     def start(self):
@@ -241,7 +248,7 @@ class PoolPump(Task, Sensor):
         if self.healthy is False:
             debug('Mark healthy in an attempt to recover on start')
             self.healthy = True
-        self._powers = []
+        self._reset_power_stats()
 
     @Pyro5.api.expose
     @Pyro5.api.oneway
@@ -285,9 +292,11 @@ class PoolPump(Task, Sensor):
         debug(f'meet_running_criteria({ratio:.3f}, {power:.3f})')
         if self.has_been_running_for() > timedelta(minutes=2):
             self.healthy = power > .2
-            self._powers.append(power)
-            self.filter_is_clean = \
-                mean(self._powers) > self._settings.clean_filter_threshold
+            self._power_count += 1
+            self._power_sum += power
+            self._power_max = max(self._power_max, power)
+            self.filter_is_clean = self._power_sum / self._power_count \
+                > self._settings.clean_filter_threshold
         return self.is_runnable() and ratio >= .9
 
     @property
@@ -299,11 +308,14 @@ class PoolPump(Task, Sensor):
     @property
     @Pyro5.api.expose
     def power(self):
-        return max(self._powers) if self._powers else self._settings.power
+        if self._power_count:
+            return self._power_max
+        return self._settings.power
 
     @Pyro5.api.expose
     def read(self, **kwargs):
-        return {'remaining_runtime': int(self.remaining_runtime.seconds / 60)}
+        return {'remaining_runtime':
+                self.remaining_runtime // timedelta(minutes=1)}
 
     @Pyro5.api.expose
     def units(self, **kwargs):
@@ -325,15 +337,14 @@ def already_ran_today_for(min_power = .5):
 
     It uses the database power table.'''
     with get_database() as database:
-        minutes = 0
-        req = f'SELECT {DEFAULT_SETTINGS["power_sensor_key"]} FROM power '
-        req += 'WHERE timestamp >= \'%s\'' \
-            % datetime.now().strftime('%Y-%m-%d 00:00:00')
+        # Let SQLite count the records rather than iterating over them.
+        req = 'SELECT COUNT(*) FROM power '
+        req += f'WHERE {DEFAULT_SETTINGS["power_sensor_key"]} > ? '
+        req += 'AND timestamp >= ?'
         cursor = database.cursor()
-        cursor.execute(req)
-        for (power,) in cursor:
-            if power > min_power:
-                minutes += 1
+        cursor.execute(req, (min_power,
+                             datetime.now().strftime('%Y-%m-%d 00:00:00')))
+        (minutes,) = cursor.fetchone()
         return timedelta(minutes=minutes)
 
 def configure_cycle(task, power_simulator, weather, pool_sensor):
@@ -433,13 +444,12 @@ def main():
         monitor.track('pool filter is clean', task.filter_is_clean)
 
         while True:
-            now = datetime.now()
-            timeout = 60 - (now.second + now.microsecond/1000000.0)
-            next_cycle = now + timedelta(seconds=timeout)
+            timeout = seconds_until_next_minute()
+            deadline = time.monotonic() + timeout
             sockets, _, _ = select(daemon.sockets, [], [])
             if sockets:
                 daemon.events(sockets)
-            if datetime.now() >= next_cycle:
+            if time.monotonic() >= deadline:
                 break
 
         # pylint: disable=maybe-no-member
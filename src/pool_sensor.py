@@ -52,7 +52,7 @@ class TemperatureSensor(Sensor):
     def __init__(self, api, uuid):
         self._uuid = uuid
         self._temperature = self._tags_to_temperature(api.load_tags())
-        debug('Temperature at init: %.2f°F' % self._temperature)
+        debug('Temperature at init: %.2f°F', self._temperature)
         self._latest_update = datetime.now()
         self._api = api
         def update(tags, events):
@@ -71,7 +71,7 @@ class TemperatureSensor(Sensor):
            and self._temperature != self._tags_to_temperature(tags):
             self._temperature = self._tags_to_temperature(tags)
             self._latest_update = datetime.now()
-            debug('Temperature update: %.2f°F' % self._temperature)
+            debug('Temperature update: %.2f°F', self._temperature)
 
     @Pyro5.api.expose
     def read(self, **kwargs):
@@ -135,7 +135,7 @@ class PowerSensor(Sensor):
                     if inner_attempt != 'final':
                         sleep(self.settings.attempt_delay)
             if attempt != 'final':
-                debug('%s: Try re-login in' % scale)
+                debug('%s: Try re-login in', scale)
                 self.vue.login(token_storage_file=self.vue.token_storage_file)
         raise RuntimeError('Could not read the device list usage')
 
@@ -193,7 +193,7 @@ class PowerSensor(Sensor):
         scale, time = self.__read_params(kwargs)
         if time is None and not self.cache[scale].has_expired():
             if scale == RecordScale.DAY:
-                debug('from cache: %s' % self.cache[scale].value)
+                debug('from cache: %s', self.cache[scale].value)
             return self.cache[scale].value
         for attempt in [ 'first', 'second', 'final']:
             if scale != RecordScale.SECOND:
@@ -206,8 +206,8 @@ class PowerSensor(Sensor):
                 if now.second == 0 and delay_on_time_unit > 0 and \
                    now.microsecond < delay_on_time_unit * 1000000:
                     delay = delay_on_time_unit - now.microsecond / 1000000
-                    debug('%s: A little bit early, delay by %.3fs'
-                          % (scale, delay))
+                    debug('%s: A little bit early, delay by %.3fs',
+                          scale, delay)
                     sleep(delay)
             try:
                 raw = self.__load(scale, time)
@@ -217,18 +217,18 @@ class PowerSensor(Sensor):
                 log_exception(msg, *sys.exc_info())
                 raise RuntimeError(msg) from err
             if scale == RecordScale.DAY:
-                debug('Raw: %s' % raw)
+                debug('Raw: %s', raw)
             usage = self.__convert(raw, scale)
             # We successfully loaded a record from the server. Unfortunately,
             # sometimes this new record is actually the one. Most likely
             # because the server has not received the latest data from the
             # sensor or was not done processing them.
             if usage == self.cache[scale].value:
-                debug('%s: Identical record on %s attempt' % (scale, attempt))
+                debug('%s: Identical record on %s attempt', scale, attempt)
                 if attempt != 'final':
                     delay = self.settings.attempt_delay
                     if delay > 0:
-                        debug("Let's retry in %.3fs" % delay)
+                        debug("Let's retry in %.3fs", delay)
                         sleep(delay)
                     else:
                         debug("Let's retry")
@@ -239,7 +239,7 @@ class PowerSensor(Sensor):
                 raise RuntimeError('Too many identical record in a row for %s'
                                    % scale)
             if scale == RecordScale.DAY:
-                debug('brand new: %s' % self.cache[scale].value)
+                debug('brand new: %s', self.cache[scale].value)
             return usage
 
     @Pyro5.api.expose
@@ -275,7 +275,7 @@ def main():
                                  settings)
             break
     if not sensor:
-        debug('Could not find %d device' % config['device_id'])
+        debug('Could not find %d device', config['device_id'])
         return
 
     daemon = Pyro5.api.Daemon()
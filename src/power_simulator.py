@@ -246,7 +246,7 @@ class PowerSimulator(Sensor):
 
         '''
         if isinstance(date, str):
-            date = parser.parse(date)
+            date = datetime.fromisoformat(date)
         date = self._norm_date(date)
         date_str = date.strftime('%Y-%m-%d %H:%M:%S')
         times = pd.date_range(date_str, date_str, freq='1S',
@@ -306,7 +306,7 @@ class PowerSimulator(Sensor):
     def max_available_power_at(self, date):
         '''Maximum power available between date and the same day dusk.'''
         if isinstance(date, str):
-            date = parser.parse(date)
+            date = datetime.fromisoformat(date)
         _, sunset = self.daytime_at(date)
         if date > sunset:
             return 0
@@ -322,7 +322,7 @@ class PowerSimulator(Sensor):
             self.end = end - timedelta(minutes=1)
             self.parent = parent
             self.reverse = reverse
-            self.length = int((self.end - self.start).seconds / 60) + 1
+            self.length = (self.end - self.start) // timedelta(minutes=1) + 1
 
         def time(self, index):
             '''Return the datetime at 'index'.'''
@@ -34,7 +34,6 @@ dynamically adjust their priority depending on their own need.
 
 '''
 
-import functools
 import os
 import sys
 import time
@@ -52,7 +51,7 @@ from cachetools import TTLCache
 from power_sensor import RecordScale
 from sensor import SensorReader
 from tools import (NameServer, Settings, debug, init, log_exception,
-                   my_excepthook)
+                   my_excepthook, seconds_until_next_minute)
 from watchdog import WatchdogProxy
 
 DEFAULT_SETTINGS = {'window_size': 12,
@@ -397,6 +396,15 @@ def compare_task(task1: Pyro5.api.Proxy, task2: Pyro5.api.Proxy) -> int:
         return 1
     return -1 if task2.power > task1.power else 0
 
+def task_sort_key(task: Pyro5.api.Proxy) -> tuple:
+    '''Return a sort key of TASK consistent with compare_task().
+
+    Sorting with this key reads the remote task properties once per task
+    instead of once per comparison.
+
+    '''
+    return (task.priority, task.auto_adjust, task.power)
+
 class SchedulerInterface:
     '''Scheduler publicly available interface.'''
 
@@ -452,7 +460,7 @@ class Scheduler(SchedulerInterface):
 
     def __running(self):
         return sorted([task for task in self.tasks if task.is_running()],
-                      key=functools.cmp_to_key(compare_task))
+                      key=task_sort_key)
 
     @property
     def running(self):
@@ -470,7 +478,7 @@ class Scheduler(SchedulerInterface):
     def __stopped(self):
         return sorted([task for task in self.runnable \
                        if not task in self.running],
-                      key=functools.cmp_to_key(compare_task), reverse=True)
+                      key=task_sort_key, reverse=True)
     @property
     def stopped(self):
         '''List of stopped task sorted by descending order of importance.'''
@@ -527,11 +535,11 @@ class Scheduler(SchedulerInterface):
         identified. Therefor, they do not run simultaneously.
 
         '''
-        running_keys = [task.keys for task in self.running]
+        running = [(task, task.keys) for task in self.running]
         tasks = []
-        for keys in running_keys:
-            for task in [task for task in self.running if task.keys == keys][1:]:
-                tasks.append(task)
+        for _, keys in running:
+            tasks += [task for task, task_keys in running \
+                      if task_keys == keys][1:]
         return tasks
 
     def __find_failing_criteria(self) -> list:
@@ -544,8 +552,8 @@ class Scheduler(SchedulerInterface):
                and task.is_stoppable():
                 # TODO: shouldn't ratio be the max for the last minute and the
                 # entire window ?
-                debug(('%s does not meet its running criteria ' +
-                       '(ratio=%.2f, %.2f KWh)') % (task.desc, ratio, power))
+                debug('%s does not meet its running criteria '
+                      '(ratio=%.2f, %.2f KWh)', task.desc, ratio, power)
                 return [task]
         return []
 
@@ -563,8 +571,8 @@ class Scheduler(SchedulerInterface):
         min_priority = max([task.priority for task in self.adjustable])
         for task in [task for task in self.running if task.is_stoppable()]:
             if not task.auto_adjust and task.priority < min_priority:
-                debug('%s prevents %s to run to their full potential' % \
-                      (task.desc, [adj.desc for adj in self.adjustable]))
+                debug('%s prevents %s to run to their full potential',
+                      task.desc, [adj.desc for adj in self.adjustable])
                 return [task]
         return []
 
@@ -588,10 +596,10 @@ class Scheduler(SchedulerInterface):
                                             minimum=minimum)
             if task.meet_running_criteria(ratio):
                 # TODO: Unless it would be able to run already.
-                debug('%s %s preventing %s to run' %
-                      ([challenger.desc for challenger in challengers],
-                       'is' if len(challengers) == 1 else 'are',
-                       task.desc))
+                debug('%s %s preventing %s to run',
+                      [challenger.desc for challenger in challengers],
+                      'is' if len(challengers) == 1 else 'are',
+                      task.desc)
                 return challengers
         return []
 
@@ -608,14 +616,14 @@ class Scheduler(SchedulerInterface):
                     if not set(task.keys).intersection(running_keys)]
         debug(f'- Eligible {[task.desc for task in eligible]}')
 
+        if self.running:
+            priority = mean([t.priority for t in self.running])
+        else:
+            priority = 0
         for task in eligible:
             ratio = self.stat.available_for(task, ignore=eligible,
                                             minimum=self.running)
             debug(f'- Current Task {task.desc} ratio {ratio:.3f}')
-            if self.running:
-                priority = mean([t.priority for t in self.running])
-            else:
-                priority = 0
             if task.meet_running_criteria(ratio) and \
                task.is_runnable() and \
                (task.priority >= priority or task.auto_adjust):
@@ -779,13 +787,12 @@ def main():
                           *sys.exc_info())
 
         while True:
-            now = datetime.now()
-            timeout = 60 - (now.second + now.microsecond/1000000.0)
-            next_cycle = now + timedelta(seconds=timeout)
+            timeout = seconds_until_next_minute()
+            deadline = time.monotonic() + timeout
             sockets, _, _ = select(daemon.sockets, [], [], timeout)
             if sockets:
                 daemon.events(sockets)
-            if datetime.now() >= next_cycle:
+            if time.monotonic() >= deadline:
                 break
 
         record = sensor.read(scale=RecordScale.MINUTE)
@@ -38,7 +38,8 @@ import Pyro5.api
 
 from power_sensor import RecordScale
 from tools import (NameServer, db_dict_factory, db_latest_record, debug,
-                   get_database, init, log_exception, my_excepthook)
+                   get_database, init, log_exception, my_excepthook,
+                   seconds_until_next_minute)
 from watchdog import WatchdogProxy
 
 
@@ -99,8 +100,7 @@ def main():
         watchdog.kick(os.getpid())
 
         now = datetime.now()
-        timeout = 60 - (now.second + now.microsecond/1000000.0)
-        sleep(timeout)
+        sleep(seconds_until_next_minute())
 
         # Daily energy record
         if now.hour == 0 and now.minute == 5:
@@ -123,15 +123,15 @@ def main():
         for name, sensor in nameserver.sensors():
             try:
                 data = sensor.read()
-            except:
-                debug('Could not read %s sensor' % name)
+            except Exception:
+                debug('Could not read %s sensor', name)
                 log_exception('Could not read %s sensor' % name,
                               *sys.exc_info())
                 debug(''.join(Pyro5.errors.get_pyro_traceback()))
                 continue
 
             if data is None or data == {}:
-                debug('Empty data from %s sensor, skipping' % name)
+                debug('Empty data from %s sensor, skipping', name)
                 continue
 
             with get_database() as database:
@@ -148,13 +148,13 @@ def main():
                 if prev[name]:
                     if data == prev[name] \
                        and name not in ['power', 'power_simulator']:
-                        debug('No change for sensor %s, skipping' % name)
+                        debug('No change for sensor %s, skipping', name)
                         continue
                     if len(data) > len(prev[name]):
                         for key, value in data.items():
                             if key in prev[name]:
                                 continue
-                            debug('Adding missing column %s' % field_name(key))
+                            debug('Adding missing column %s', field_name(key))
                             req = 'ALTER TABLE %s ADD COLUMN %s %s' \
                                 % (name, field_name(key), field_type(value))
                             execute(cursor, req)
@@ -30,15 +30,17 @@
 
 import logging
 import os
-import re
+import pickle
 import shelve
 import signal
 import sqlite3
 import sys
 import traceback
+from ast import literal_eval
 from configparser import ConfigParser
 from logging.handlers import TimedRotatingFileHandler
 from os.path import basename, splitext
+from time import time
 
 import Pyro5.api
 
@@ -66,14 +68,19 @@ def init(log_file=None):
         _LOGGER = _create_logger(log_file)
     return _CONFIG
 
-def debug(text):
-    '''Record text to the log file.'''
+def debug(text, *args):
+    '''Record text to the log file.
+
+    'args' are merged into 'text' using the %-format operator, only if the
+    record is actually emitted.
+
+    '''
     if _LOGGER:
-        _LOGGER.debug(text)
+        _LOGGER.debug(text, *args)
 
 def log_exception(msg, exc_type, exc_value, exc_traceback):
     '''Record the msg and the exception to the log file.'''
-    debug(msg + ', %s' % exc_type)
+    debug('%s, %s', msg, exc_type)
     for line in traceback.format_exception(exc_type, exc_value, exc_traceback):
         debug(line[:-1])
 
@@ -81,34 +88,57 @@ class Settings:
     '''Represent key/value pair settings.
 
     Settings can be loaded from the configuration file. All the key/value pair
-    under the 'settings' are loaded as attributes of the Settings object.
+    under the 'settings' are loaded as attributes of the Settings object. The
+    type of the default value decides how the configuration value is parsed.
 
     '''
     def __init__(self, filename: str, defaults: dict):
         self.__filename = filename
-        self.__keys = defaults.keys()
+        self.__defaults = defaults
+        self.__mtime = None
+        self.__config = ConfigParser()
         for key, value in defaults.items():
             setattr(self, key, value)
         self.load()
 
     def load(self):
-        '''Load the settings from filename supplied at construction.'''
-        if not os.path.exists(self.__filename):
+        '''Load the settings from filename supplied at construction.
+
+        The file is only parsed again if it has been modified since the last
+        load.
+
+        '''
+        try:
+            mtime = os.stat(self.__filename).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self.__mtime:
             return
-        config = ConfigParser()
+        config = self.__config
+        config.clear()
+        config.defaults().clear()
         config.read(self.__filename)
         if 'settings' not in config:
             raise ValueError('Invalid settings file %s' % self.__filename)
-        for key in self.__keys:
-            if key in config['settings']:
-                try:
-                    setattr(self, key, float(config['settings'][key]))
-                except ValueError:
-                    setattr(self, key, bool(config['settings'][key]))
+        self.__mtime = mtime
+        section = config['settings']
+        for key, default in self.__defaults.items():
+            if key not in section:
+                continue
+            if isinstance(default, bool):
+                value = section.getboolean(key)
+            elif isinstance(default, str):
+                value = section[key]
+            elif isinstance(default, (dict, list, tuple)):
+                value = literal_eval(section[key])
+            else:
+                value = float(section[key])
+            setattr(self, key, value)
 
 def get_storage():
     '''Return a shelve object for dynamic data storage.'''
-    return shelve.open(os.getenv('HOME') + '/storage', protocol=2)
+    return shelve.open(os.getenv('HOME') + '/storage',
+                       protocol=pickle.HIGHEST_PROTOCOL)
 
 def get_database():
     '''Return a SQLite object for persistent data storage.'''
@@ -174,10 +204,14 @@ class NameServer:
 
     def __call(self, method, *args):
         for _ in range(2):
-            try:
-                self.nameserver = Pyro5.api.locate_ns()
-            except Pyro5.errors.PyroError:
-                log_exception('Cannot locate the nameserver', *sys.exc_info())
+            # Locating the nameserver is a network lookup, keep using the
+            # proxy until it fails.
+            if not self.nameserver:
+                try:
+                    self.nameserver = Pyro5.api.locate_ns()
+                except Pyro5.errors.PyroError:
+                    log_exception('Cannot locate the nameserver',
+                                  *sys.exc_info())
             if self.nameserver:
                 try:
                     return getattr(self.nameserver, method)(*args)
@@ -186,17 +220,17 @@ class NameServer:
                 except Pyro5.errors.PyroError:
                     log_exception('Failed to communicate with the nameserver',
                                   *sys.exc_info())
+                    self.nameserver = None
         raise RuntimeError('Could not access the nameserver')
 
     def path(self, qualifier, name):
         return '%s.%s.%s' % (self.base_uri, qualifier, name)
 
     def generator(self, qualifier):
-        pattern = re.compile('%s.%s\\..*' % (self.base_uri, qualifier))
-        preffix_len = (len(self.base_uri) + len(qualifier) + 2)
+        prefix = self.path(qualifier, '')
         for name, uri in self.__call('list').items():
-            if pattern.search(name):
-                yield name[preffix_len:], Pyro5.api.Proxy(uri)
+            if name.startswith(prefix):
+                yield name[len(prefix):], Pyro5.api.Proxy(uri)
 
     def register(self, qualifier, name, uri):
         if qualifier not in self.QUALIFIERS:
@@ -245,6 +279,10 @@ def kilometers(miles):
 def meter_per_second(mph):
     return mph / 2.237
 
+def seconds_until_next_minute():
+    '''Return the number of seconds until the beginning of the next minute.'''
+    return 60 - time() % 60
+
 def my_excepthook(etype, value=None, traceback=None):
     '''On uncaught exception, log the exception and kill the process.'''
     if value:
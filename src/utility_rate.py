@@ -30,16 +30,16 @@
 import os
 import select
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import IntEnum
 from select import select
+from time import monotonic
 
 import Pyro5.api
-from dateutil import parser
 
 from sensor import Sensor
 from tools import (NameServer, Settings, debug, init, log_exception,
-                   my_excepthook)
+                   my_excepthook, seconds_until_next_minute)
 from watchdog import WatchdogProxy
 
 DEFAULT_SETTINGS = {'export': 0.0281,
@@ -61,33 +61,46 @@ class UtilityRateSensor(Sensor):
 
     def __init__(self, settings):
         self.settings = settings
+        self._on_peak_key = None
+        self.update()
+
+    def update(self):
+        '''Build the on-peak lookup table, indexed by month and hour.
+
+        It should be called after the settings have been reloaded. The table
+        is only rebuilt if the seasons or the on-peak schedule have changed.
+
+        '''
+        key = repr((self.settings.seasons, self.settings.on_peak_schedule))
+        if key == self._on_peak_key:
+            return
+        self._on_peak_key = key
+        self._on_peak = [[False] * 24 for _ in range(12)]
+        for month, season in enumerate(self.settings.seasons):
+            for start, end in self.settings.on_peak_schedule[season]:
+                for hour in range(start, end + 1):
+                    self._on_peak[month][hour] = True
 
     def rate(self, date):
-        if date.weekday() in [ self.WEEKDAYS.sat, self.WEEKDAYS.sun ]:
-            rate_category = 'off_peak'
+        if date.weekday() not in [ self.WEEKDAYS.sat, self.WEEKDAYS.sun ] \
+           and self._on_peak[date.month - 1][date.hour]:
+            rate_category = 'on_peak'
         else:
             rate_category = 'off_peak'
-            season = self.settings.seasons[date.month - 1]
-            on_peak_schedule = self.settings.on_peak_schedule[season]
-            for schedule in on_peak_schedule:
-                if schedule[0] <= date.hour <= schedule[1]:
-                    rate_category = 'on_peak'
-                    break
         return getattr(self.settings, rate_category + '_rates')[date.month - 1]
 
     @Pyro5.api.expose
     def read(self, **kwargs):
-        date = kwargs.get('date', datetime.now())
-        if isinstance(date, str):
-            date = parser.parse(date)
+        date = kwargs.get('date')
+        if date is None:
+            date = datetime.now()
+        elif isinstance(date, str):
+            date = datetime.fromisoformat(date)
         return {'from_grid': self.rate(date),
                 'to_grid': self.settings.export}
 
     @Pyro5.api.expose
     def units(self, **kwargs):
-        date = kwargs.get('date', datetime.now())
-        if isinstance(date, str):
-            date = parser.parse(date)
         return {k:'$/kWh' for k, _ in self.read().items()}
 
 def register(name, uri, raise_exception=True):
@@ -118,6 +131,7 @@ def main():
     debug("... is now ready to run")
     while True:
         settings.load()
+        sensor.update()
 
         watchdog.register(os.getpid(), module_name)
         watchdog.kick(os.getpid())
@@ -125,13 +139,12 @@ def main():
         register(module_name, uri, raise_exception=False)
 
         while True:
-            now = datetime.now()
-            timeout = 60 - (now.second + now.microsecond/1000000.0)
-            next_cycle = now + timedelta(seconds=timeout)
+            timeout = seconds_until_next_minute()
+            deadline = monotonic() + timeout
             sockets, _, _ = select(daemon.sockets, [], [], timeout)
             if sockets:
                 daemon.events(sockets)
-            if datetime.now() >= next_cycle:
+            if monotonic() >= deadline:
                 break
 
 if __name__ == "__main__":
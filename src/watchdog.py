@@ -126,12 +126,12 @@ class Watchdog(WatchdogInterface):
         if pid not in self._processes:
             process = Process(name, pid, timeout)
             self._processes[pid] = process
-            debug('Start monitoring %s' % process)
+            debug('Start monitoring %s', process)
 
     @Pyro5.api.expose
     def unregister(self, pid: int) -> None:
         if pid in self._processes:
-            debug('Stop monitoring %s' % self._processes[pid])
+            debug('Stop monitoring %s', self._processes[pid])
             del self._processes[pid]
 
     @Pyro5.api.expose
@@ -152,7 +152,7 @@ class Watchdog(WatchdogInterface):
             except RuntimeError:
                 pass
             if not alive:
-                debug('Process %s does not exist anymore' % process)
+                debug('Process %s does not exist anymore', process)
                 self.unregister(process.pid)
 
     def kill_hung_processes(self) -> None:
@@ -160,7 +160,7 @@ class Watchdog(WatchdogInterface):
         hung = [proc for proc in self._processes.values() \
                 if proc.timer_has_expired()]
         for process in hung:
-            debug('Killing %s hung process' % process)
+            debug('Killing %s hung process', process)
             process.kill(signal.SIGTERM)
             for _ in range(3):
                 if not process.is_alive():
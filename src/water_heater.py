@@ -46,7 +46,7 @@ from power_simulator import PowerSimulatorProxy
 from scheduler import Priority, SchedulerProxy, Task
 from sensor import Sensor
 from tools import (NameServer, Settings, debug, fahrenheit, init,
-                   log_exception, my_excepthook)
+                   log_exception, my_excepthook, seconds_until_next_minute)
 from watchdog import WatchdogProxy
 
 DEFAULT_SETTINGS = {'power': 4.65,
@@ -152,8 +152,8 @@ class WaterHeater(Task, Sensor):
         # Water tank level has decreased, make the task runnable
         if self.state.tank_level is not None \
            and self.state.tank_level > state['available']:
-            debug('Making runnable %s %s' \
-                  % (self.state.tank_level, state['available']))
+            debug('Making runnable %s %s',
+                  self.state.tank_level, state['available'])
             self._not_runnable_till = datetime.min
         self.state.update(state['temperature'], state['available'],
                           force=force)
@@ -227,7 +227,7 @@ class WaterHeater(Task, Sensor):
         if self.mode == 'away':
             self.mode = 'timer'
         duration = max(self.estimate_run_time(), self.min_run_time)
-        debug('Starting for %s' % duration)
+        debug('Starting for %s', duration)
         self.started_at = datetime.now()
         self._not_runnable_till = datetime.min
         self.mode = ('boost', duration)
@@ -297,7 +297,7 @@ class WaterHeater(Task, Sensor):
           'no_power_delay'.
 
         '''
-        debug('meet_running_criteria(%.3f, %.3f)' % (ratio, power))
+        debug('meet_running_criteria(%.3f, %.3f)', ratio, power)
         duration = self.has_been_running_for()
         if duration > timedelta():
             if duration >= timedelta(minutes=3):
@@ -314,13 +314,13 @@ class WaterHeater(Task, Sensor):
                 if duration > timedelta(minutes=3):
                     delay *= 4
                 self._not_runnable_till = datetime.now() + delay
-                debug('Not using enough power, make unrunnable till %s'
-                      % self._not_runnable_till)
+                debug('Not using enough power, make unrunnable till %s',
+                      self._not_runnable_till)
                 return False
         # Accept to operate with any ratio if we are too close to the target
         # time and the priority level is URGENT.
-        debug('target_time=%s' % self.target_time)
-        debug('estimate_run_time()=%s' % self.estimate_run_time())
+        debug('target_time=%s', self.target_time)
+        debug('estimate_run_time()=%s', self.estimate_run_time())
         if self.priority == Priority.URGENT \
            and self.target_time - datetime.now() < self.estimate_run_time():
             return True
@@ -440,7 +440,7 @@ def device_exist_assert(device_id, aquanta):
     '''
     try:
         if device_id not in aquanta:
-            debug('%d device does not exist' % device_id)
+            debug('%d device does not exist', device_id)
             sys.exit(os.EX_DATAERR)
     except (RuntimeError, requests.exceptions.RequestException):
         debug('Could not access Aquanta device list')
@@ -495,13 +495,12 @@ def main():
                 pass
 
         while True:
-            now = datetime.now()
-            timeout = 60 - (now.second + now.microsecond/1000000.0)
-            next_cycle = now + timedelta(seconds=timeout)
+            timeout = seconds_until_next_minute()
+            deadline = time.monotonic() + timeout
             sockets, _, _ = select(daemon.sockets, [], [], timeout)
             if sockets:
                 daemon.events(sockets)
-            if datetime.now() >= next_cycle:
+            if time.monotonic() >= deadline:
                 break
         try:
             task.adjust_priority()
@@ -517,7 +516,7 @@ def main():
             try:
                 _, target_time = power_simulator.next_power_window(task.power)
                 task.target_time = parser.parse(target_time)
-                debug('target_time updated to %s' % task.target_time)
+                debug('target_time updated to %s', task.target_time)
             except (ValueError, RuntimeError) as err:
                 debug(str(err))
 
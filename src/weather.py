@@ -32,23 +32,27 @@ import os
 import random
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from select import select
 from string import ascii_lowercase
-from time import sleep
+from time import sleep, time
 
+import numpy as np
 import pyowm
 import Pyro5.api
 import requests
 from cachetools import TTLCache
 from dateutil import parser, tz
 from geopy.geocoders import Nominatim
-from scipy.interpolate import interp1d
 
 from monitor import MonitorProxy
 from sensor import Sensor
 from tools import NameServer, debug, init, log_exception, miles, my_excepthook
 from watchdog import WatchdogProxy
 
+# tz.gettz() reads the tzdata file on each call. The forecast timezone does not
+# change between refreshes and tzinfo objects are immutable.
+_gettz = lru_cache(maxsize=8)(tz.gettz)
 
 class WeatherSensor(Sensor):
     '''Provide instantaneous weather information as a Sensor.
@@ -112,8 +116,9 @@ class WeatherForecastService:
         self.longitude = longitude
         self.monitor = monitor
         self.timezone = None
-        self.interp = {}
-        self.last_attempt = datetime.min
+        self.times = None
+        self._conditions_at = None
+        self.refresh_after = 0.0
 
     @staticmethod
     def _get(url: str) -> dict:
@@ -130,11 +135,11 @@ class WeatherForecastService:
 
     def _load_forecast_data(self):
         debug('Loading Forecast data')
-        self.last_attempt = datetime.now()
+        self.refresh_after = time() + 60 * 60
         data = self._get(self.API + '/points/%.2f,%.2f' %
                          (self.latitude, self.longitude))
         try:
-            self.timezone = tz.gettz(data['properties']['timeZone'])
+            self.timezone = _gettz(data['properties']['timeZone'])
             forecast_url = data['properties']['forecastHourly'] + '?units=us'
             periods = self._get(forecast_url)['properties']['periods']
         except KeyError as err:
@@ -143,14 +148,29 @@ class WeatherForecastService:
         valid_data = now <= (self._str2time(periods[0]['startTime'])
                              + timedelta(hours=2))
         if valid_data:
-            times = [self._str2time(period['startTime']).timestamp() \
-                     for period in periods]
+            times = np.array([self._str2time(period['startTime']).timestamp() \
+                              for period in periods])
             conditions = [self._conditions(period) for period in periods]
-            for cond in self.CONDITION:
-                self.interp[cond] = interp1d(times,
-                                            [c[cond] for c in conditions])
+            temperature, wind_speed, wind_degree = \
+                (np.array([c[cond] for c in conditions], dtype=float) \
+                 for cond in self.CONDITION)
+
+            # Specialized for the CONDITION fields to keep conditions_at() as
+            # cheap as possible.
+            def conditions_at(timestamp):
+                if not times[0] <= timestamp <= times[-1]:
+                    raise ValueError('%s is out of the forecast range'
+                                     % timestamp)
+                return {'temperature':
+                        float(np.interp(timestamp, times, temperature)),
+                        'wind_speed':
+                        float(np.interp(timestamp, times, wind_speed)),
+                        'wind_degree':
+                        float(np.interp(timestamp, times, wind_degree))}
+            self.times = times
+            self._conditions_at = conditions_at
         else:
-            debug('%s forecast period is outdated' % periods[0]['startTime'])
+            debug('%s forecast period is outdated', periods[0]['startTime'])
         self.monitor.track('weather forecast data', valid_data)
 
     def _str2time(self, string: str):
@@ -162,12 +182,10 @@ class WeatherForecastService:
                 'wind_degree': self.DEGREE[period['windDirection']]}
 
     def _forecast_and_timezone(self):
-        interp = self.interp.get('temperature', None)
-        if self.timezone is None or interp is None \
-           or datetime.now() > self.last_attempt + timedelta(hours=1):
+        if self.timezone is None or self._conditions_at is None \
+           or time() > self.refresh_after:
             self._load_forecast_data()
-            interp = self.interp.get('temperature', None)
-        if self.timezone is None or interp is None:
+        if self.timezone is None or self._conditions_at is None:
             raise RuntimeError('Could not get forecast data')
 
     @Pyro5.api.expose
@@ -179,20 +197,19 @@ class WeatherForecastService:
 
         '''
         if isinstance(target, str):
-            target = parser.parse(target)
+            target = datetime.fromisoformat(target)
         self._forecast_and_timezone()
         timestamp = target.astimezone(self.timezone).timestamp()
         try:
-            return {cond:self.interp[cond](timestamp).item() \
-                    for cond in self.CONDITION}
+            return self._conditions_at(timestamp)
         except ValueError as err:
             raise RuntimeError('%s weather data is not available' % target) \
                 from err
 
     def _temperatures(self, hours):
         self._forecast_and_timezone()
-        start = self.interp['temperature'].x[0]
-        return [self.interp['temperature'](start + i * 60 * 60).item() \
+        start = self.times[0]
+        return [self._conditions_at(start + i * 60 * 60)['temperature'] \
                 for i in range(hours)]
 
     @Pyro5.api.expose